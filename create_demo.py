@@ -4,6 +4,7 @@ Demo script for Zelda Claude Code
 Run this and record your screen to create a demo GIF!
 """
 
+import os
 import time
 import subprocess
 import sys
@@ -23,11 +24,51 @@ class Colors:
 
 def print_slow(text, delay=0.03):
     """Print text with typewriter effect"""
+    # No animation when nobody is watching
+    if os.environ.get('CI'):
+        print(text)
+        return
+    
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    # Pace against a monotonic deadline so sleep jitter doesn't accumulate
+    deadline = time.monotonic()
     for char in text:
-        print(char, end='', flush=True)
-        time.sleep(delay)
+        write(char)
+        flush()
+        deadline += delay
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
     print()
 
+# One hook process serves every demo event (see zelda_hook.py --stdin-loop)
+_hook_process = None
+
+def send_hook_event(event):
+    """Send an event to the persistent hook process and return its JSON reply"""
+    global _hook_process
+    if _hook_process is None:
+        _hook_process = subprocess.Popen(
+            ["python3", "-u", "hooks/zelda_hook.py", "--stdin-loop"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+    
+    _hook_process.stdin.write(json.dumps(event) + "\n")
+    _hook_process.stdin.flush()
+    reply = _hook_process.stdout.readline()
+    return json.loads(reply) if reply else {}
+
+def stop_hook():
+    """Shut down the persistent hook process"""
+    global _hook_process
+    if _hook_process is not None:
+        _hook_process.stdin.close()
+        _hook_process.wait()
+        _hook_process = None
+
 def clear_screen():
     """Clear the terminal screen"""
     print("\033[2J\033[H")
@@ -38,24 +79,15 @@ def run_zelda_command(command):
     time.sleep(0.5)
     
     # Call the actual hook
-    input_data = json.dumps({
+    output = send_hook_event({
         "hook_event_name": "UserPromptSubmit",
         "prompt": command
     })
     
-    result = subprocess.run(
-        ["python3", "hooks/zelda_hook.py"],
-        input=input_data,
-        capture_output=True,
-        text=True
-    )
-    
-    if result.returncode == 0 and result.stdout:
-        output = json.loads(result.stdout)
-        if output.get('decision') == 'block':
-            # Parse and display the markdown nicely
-            response = output.get('reason', '')
-            print(response)
+    if output.get('decision') == 'block':
+        # Parse and display the markdown nicely
+        response = output.get('reason', '')
+        print(response)
     
     time.sleep(1.5)
 
@@ -74,19 +106,12 @@ def simulate_coding():
         time.sleep(0.5)
         
         # Simulate tool execution
-        input_data = json.dumps({
+        send_hook_event({
             "hook_event_name": "PostToolUse",
             "tool_name": tool,
             "tool_status": "success" if success else "error"
         })
         
-        subprocess.run(
-            ["python3", "hooks/zelda_hook.py"],
-            input=input_data,
-            capture_output=True,
-            text=True
-        )
-        
         if success:
             print(f"{Colors.GREEN}✓ Success!{Colors.END}")
         else:
@@ -146,6 +171,8 @@ def main():
     print(f"\n{Colors.CYAN}Install now:{Colors.END}")
     print("github.com/linjiw/claude-code-but-zelda")
     print(f"\n{Colors.YELLOW}May the Triforce guide your code! 🗡️✨{Colors.END}\n")
+    
+    stop_hook()
 
 if __name__ == "__main__":
     print("\n🎬 Starting demo in 3 seconds...")
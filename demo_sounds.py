@@ -10,8 +10,12 @@ from pathlib import Path
 scripts_dir = Path(__file__).parent / "scripts"
 sys.path.insert(0, str(scripts_dir))
 
+# Blocking player, called directly: it returns once the clip has finished
 from play_sound import play_sound
 
+# Minimum time from the start of one sound to the start of the next
+SOUND_INTERVAL = 1.5
+
 def demo_sounds():
     """Play all sounds in sequence with descriptions"""
     
@@ -30,10 +34,16 @@ def demo_sounds():
     print("\n🎮 ZELDA CLAUDE CODE - SOUND DEMO 🎮\n")
     print("Playing all sounds...\n")
     
-    for sound_name, description in sounds:
-        print(f"  {description}")
-        play_sound(sound_name)
-        time.sleep(1.5)  # Wait between sounds
+    try:
+        for sound_name, description in sounds:
+            print(f"  {description}")
+            started = time.monotonic()
+            play_sound(sound_name)
+            # Short clips still get the full interval; long ones never overlap
+            time.sleep(max(0, started + SOUND_INTERVAL - time.monotonic()))
+    except KeyboardInterrupt:
+        print("\n⏹️  Demo stopped")
+        return
     
     print("\n✨ Demo complete! Happy coding!\n")
 
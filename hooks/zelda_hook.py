@@ -6,17 +6,24 @@ With performance optimizations for faster response times
 """
 
 import json
+import os
 import sys
-import subprocess
 import time
-import platform
+import re
 import tempfile
-from pathlib import Path
+
+# Plain string paths, worked out once per process
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NOTIFICATIONS_FILE = os.path.join(tempfile.gettempdir(), "zelda_notifications.log")
 
 # Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, ROOT_DIR)
 
-from zelda_core import get_manager
+# Prefer orjson for decoding hook payloads when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Performance optimizations (lazy loaded)
 _optimizations = None
@@ -26,15 +33,27 @@ def get_optimizations():
     global _optimizations
     if _optimizations is None:
         try:
+            from pathlib import Path
             from performance_optimizations import initialize_optimizations
-            _optimizations = initialize_optimizations(SOUNDS_DIR)
+            _optimizations = initialize_optimizations(Path(SOUNDS_DIR))
         except ImportError:
             # Fallback if optimizations not available
             _optimizations = {}
     return _optimizations
 
 # Get the sounds directory
-SOUNDS_DIR = Path(__file__).parent.parent / "sounds"
+SOUNDS_DIR = os.path.join(ROOT_DIR, "sounds")
+
+def _scan_sounds(sounds_dir):
+    """Map each .wav file name in sounds_dir to its full path"""
+    try:
+        with os.scandir(sounds_dir) as entries:
+            return {entry.name: entry.path for entry in entries if entry.name.endswith(".wav")}
+    except OSError:
+        return {}
+
+# Sounds available this run, listed once instead of stat()ing per play
+SOUND_PATHS = _scan_sounds(SOUNDS_DIR)
 
 # Tool-to-sound mapping
 TOOL_SOUND_MAP = {
@@ -54,6 +73,24 @@ TOOL_SOUND_MAP = {
     "ExitPlanMode": {"success": "menu_select.wav"},
 }
 
+# Flattened (tool, outcome) -> sound table so each lookup is a single dict get
+SOUND_TABLE = {
+    (tool, outcome): sound
+    for tool, sounds in TOOL_SOUND_MAP.items()
+    for outcome, sound in sounds.items()
+}
+
+# Sound for an outcome when the tool has no sound of its own
+DEFAULT_FOR_OUTCOME = {
+    "success": "success.wav",
+    "error": "error.wav",
+    "completed": "heart_get.wav",
+    "all_complete": "achievement.wav",
+}
+
+# Words that mark a plain-text tool response as a failure
+ERROR_WORDS_RE = re.compile(r"error|failed|exception", re.IGNORECASE)
+
 # Hook event sounds
 HOOK_EVENT_SOUNDS = {
     "Notification": "warning.wav",
@@ -63,108 +100,66 @@ HOOK_EVENT_SOUNDS = {
     "PreCompact": "menu_select.wav"
 }
 
-# Get manager instance
-manager = get_manager()
+# Zelda manager (lazy loaded)
+_manager = None
+
+def get_zelda_manager():
+    """Lazy load the Zelda manager and its saved config, stats and achievements"""
+    global _manager
+    if _manager is None:
+        from zelda_core import get_manager
+        _manager = get_manager()
+    return _manager
+
+# Player lookup and sound daemon client, shared with the sound scripts
+sys.path.insert(0, os.path.join(ROOT_DIR, "scripts"))
+from sound_client import SYSTEM, find_player, spawn_player, play_with_daemon
+
+# Gap between sounds played back to back
+SOUND_SPACING_MS = 200
 
 def play_sound_async(sound_file):
-    """Play a sound file asynchronously with caching support"""
-    opts = get_optimizations()
+    """Play a sound file asynchronously"""
+    if not get_zelda_manager().sounds_enabled:
+        return
     
-    # Use cached sound path if available
-    if "sound_cache" in opts:
-        sound_path = opts["sound_cache"].get_sound_path_or_cache(sound_file)
-        if not sound_path:
-            return
-    else:
-        sound_path = SOUNDS_DIR / sound_file
-        if not sound_path.exists():
-            return
+    sound_path = SOUND_PATHS.get(sound_file)
+    if not sound_path:
+        return
     
-    if manager.config["sounds"]["enabled"]:
-        volume = manager.config.get("volume", 100) / 100.0
-        # Cross-platform audio playback
-        system = platform.system()
-        
-        try:
-            if system == 'Darwin':  # macOS
-                subprocess.Popen(
-                    ["afplay", str(sound_path)],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-            elif system == 'Linux':
-                # Try multiple Linux audio players in order of preference
-                players = ['aplay', 'paplay', 'ffplay', 'mpg123']
-                for player in players:
-                    try:
-                        if player == 'ffplay':
-                            subprocess.Popen(
-                                [player, '-nodisp', '-autoexit', str(sound_path)],
-                                stdout=subprocess.DEVNULL,
-                                stderr=subprocess.DEVNULL
-                            )
-                        else:
-                            subprocess.Popen(
-                                [player, str(sound_path)],
-                                stdout=subprocess.DEVNULL,
-                                stderr=subprocess.DEVNULL
-                            )
-                        break  # Success, exit the loop
-                    except FileNotFoundError:
-                        continue  # Try next player
-            elif system == 'Windows':
-                # Windows sound playback with multiple fallback methods
-                sound_played = False
-                
-                # Method 1: Try using winsound module (built-in on Windows)
-                try:
-                    import winsound
-                    # Use SND_ASYNC to play asynchronously
-                    winsound.PlaySound(str(sound_path), winsound.SND_FILENAME | winsound.SND_ASYNC)
-                    sound_played = True
-                except (ImportError, Exception):
-                    pass
-                
-                # Method 2: Try PowerShell with different executables
-                if not sound_played:
-                    powershell_cmds = ['powershell.exe', 'pwsh.exe', 'powershell', 'pwsh']
-                    for ps_exe in powershell_cmds:
-                        try:
-                            # Simpler PowerShell command that's more likely to work
-                            ps_command = f'(New-Object Media.SoundPlayer "{str(sound_path)}").PlaySync()'
-                            subprocess.Popen(
-                                [ps_exe, '-WindowStyle', 'Hidden', '-Command', ps_command],
-                                stdout=subprocess.DEVNULL,
-                                stderr=subprocess.DEVNULL,
-                                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-                            )
-                            sound_played = True
-                            break
-                        except (FileNotFoundError, OSError):
-                            continue
-                
-                # Method 3: Try Windows Media Player as last resort
-                if not sound_played:
-                    try:
-                        # Use start command to play with default audio player
-                        subprocess.Popen(
-                            ['cmd', '/c', 'start', '/min', '', str(sound_path)],
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                            shell=False
-                        )
-                    except Exception:
-                        pass
-        except Exception:
-            # Silently fail - don't interrupt workflow
-            pass
+    # Hand off to the sound daemon when it is running
+    if SYSTEM in ('Darwin', 'Linux') and play_with_daemon([sound_path]):
+        return
+    
+    # Cross-platform audio playback
+    try:
+        if SYSTEM in ('Darwin', 'Linux'):
+            player = find_player()
+            if player:
+                spawn_player(player + [sound_path])
+        elif SYSTEM == 'Windows':
+            # winsound ships with Python on Windows and SND_ASYNC returns immediately
+            import winsound
+            winsound.PlaySound(sound_path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+    except Exception:
+        # Silently fail - don't interrupt workflow
+        pass
 
 def play_multiple_sounds(sounds):
     """Play multiple sounds with slight delay"""
+    if not get_zelda_manager().sounds_enabled:
+        return
+    
+    # Let the sound daemon do the spacing so the hook can exit right away
+    if SYSTEM in ('Darwin', 'Linux'):
+        sound_paths = [SOUND_PATHS[sound] for sound in sounds if sound in SOUND_PATHS]
+        if not sound_paths or play_with_daemon(sound_paths, SOUND_SPACING_MS):
+            return
+    
     for i, sound in enumerate(sounds):
-        if sound and manager.config["sounds"]["enabled"]:
+        if sound:
             if i > 0:
-                subprocess.Popen(["sleep", "0.2"]).wait()
+                time.sleep(SOUND_SPACING_MS / 1000)
             play_sound_async(sound)
 
 def determine_tool_success(tool_name, response):
@@ -175,47 +170,44 @@ def determine_tool_success(tool_name, response):
         if "exitCode" in response:
             return response["exitCode"] == 0
     elif isinstance(response, str):
-        return not any(word in response.lower() for word in ["error", "failed", "exception"])
+        return not ERROR_WORDS_RE.search(response)
     return True
 
-def get_tool_sound(tool_name, response):
+def get_tool_sound(tool_name, response, is_success):
     """Get appropriate sound for tool execution"""
-    if tool_name not in TOOL_SOUND_MAP:
-        return "success.wav" if determine_tool_success(tool_name, response) else "error.wav"
-    
-    tool_sounds = TOOL_SOUND_MAP[tool_name]
-    is_success = determine_tool_success(tool_name, response)
+    outcome = "success" if is_success else "error"
     
     # Special cases
     if tool_name == "TodoWrite" and isinstance(response, dict) and "todos" in response:
         todos = response["todos"]
-        completed = sum(1 for t in todos if t.get("status") == "completed")
+        completed = [t.get("status") for t in todos].count("completed")
         if completed == len(todos) and completed > 0:
-            return tool_sounds.get("all_complete", "achievement.wav")
+            outcome = "all_complete"
         elif completed > 0:
-            return tool_sounds.get("completed", "heart_get.wav")
+            outcome = "completed"
     
-    return tool_sounds.get("success" if is_success else "error", "success.wav" if is_success else "error.wav")
+    return SOUND_TABLE.get((tool_name, outcome), DEFAULT_FOR_OUTCOME[outcome])
 
 def handle_user_prompt(prompt):
-    """Handle user prompts, intercepting @zelda commands"""
+    """Handle user prompts, intercepting @zelda commands
+    
+    Returns the hook output to print, or None to let the prompt through.
+    """
     # Check if this is a @zelda command
     if prompt.strip().lower().startswith("@zelda"):
         # Process the command
-        response = manager.process_command(prompt.strip())
+        response = get_zelda_manager().process_command(prompt.strip())
         
         if response:
             # Return the formatted response for Claude to display
-            output = {
+            return {
                 "decision": "block",  # Prevent the prompt from being processed normally
                 "reason": response,   # This will be shown to the user
                 "suppressOutput": True
             }
-            print(json.dumps(output))
-            sys.exit(0)
     
     # Not a @zelda command, let it proceed normally
-    sys.exit(0)
+    return None
 
 def handle_tool_execution(tool_name, response):
     """Handle tool execution events with debouncing"""
@@ -234,10 +226,10 @@ def handle_tool_execution(tool_name, response):
     is_success = determine_tool_success(tool_name, response)
     
     # Get base sound
-    tool_sound = get_tool_sound(tool_name, response)
+    tool_sound = get_tool_sound(tool_name, response, is_success)
     
     # Record command and get additional sounds (combo, achievements)
-    additional_sounds = manager.record_command(tool_name, is_success)
+    additional_sounds = get_zelda_manager().record_command(tool_name, is_success)
     
     # Play all sounds
     all_sounds = [tool_sound] + additional_sounds
@@ -250,83 +242,169 @@ def handle_tool_execution(tool_name, response):
 
 def handle_session_start(session_id):
     """Handle session start"""
-    manager.start_session(session_id)
+    get_zelda_manager().start_session(session_id)
     play_sound_async("session_start.wav")
     
-    # Check for notifications
-    temp_dir = Path(tempfile.gettempdir())
-    notifications_file = temp_dir / "zelda_notifications.log"
-    if notifications_file.exists():
-        # Clear old notifications
-        try:
-            notifications_file.unlink()
-        except Exception:
-            pass
+    # Clear old notifications (truncate in place, the manager may hold it open)
+    try:
+        os.truncate(NOTIFICATIONS_FILE, 0)
+    except OSError:
+        pass
 
 def handle_session_end():
     """Handle session end"""
-    manager.end_session()
+    get_zelda_manager().end_session()
     play_sound_async("session_night.wav")
 
-def main():
-    """Main hook handler"""
-    try:
-        # Read JSON input from stdin
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        sys.exit(0)
-    
-    # Extract event information
-    hook_event = input_data.get("hook_event_name", "")
+# Start sounds for PreToolUse events
+PRE_TOOL_SOUNDS = {
+    "Bash": "item_small.wav",
+    "Task": "notification.wav",
+}
+
+def on_user_prompt(input_data):
+    """Handle UserPromptSubmit"""
+    return handle_user_prompt(input_data.get("prompt", ""))
+
+def on_session_start(input_data):
+    """Handle SessionStart"""
+    handle_session_start(input_data.get("session_id", ""))
+
+def on_stop(input_data):
+    """Handle Stop"""
+    handle_session_end()
+
+def on_post_tool_use(input_data):
+    """Handle PostToolUse"""
     tool_name = input_data.get("tool_name", "")
-    tool_response = input_data.get("tool_response", {})
-    session_id = input_data.get("session_id", "")
-    prompt = input_data.get("prompt", "")
-    
-    # Handle different events
-    if hook_event == "UserPromptSubmit":
-        handle_user_prompt(prompt)
-    
-    elif hook_event == "SessionStart":
-        handle_session_start(session_id)
+    if tool_name:
+        handle_tool_execution(tool_name, input_data.get("tool_response", {}))
+
+def on_pre_tool_use(input_data):
+    """Handle PreToolUse, playing start sounds for certain tools"""
+    sound = PRE_TOOL_SOUNDS.get(input_data.get("tool_name", ""))
+    if sound:
+        play_sound_async(sound)
+
+# Hook event -> handler, looked up once per event
+EVENT_HANDLERS = {
+    "UserPromptSubmit": on_user_prompt,
+    "SessionStart": on_session_start,
+    "Stop": on_stop,
+    "PostToolUse": on_post_tool_use,
+    "PreToolUse": on_pre_tool_use,
+}
+
+def handle_event(input_data):
+    """Handle a single hook event, returning the hook output (or None)"""
+    hook_event = input_data.get("hook_event_name", "")
     
-    elif hook_event == "Stop":
-        handle_session_end()
+    handler = EVENT_HANDLERS.get(hook_event)
+    if handler:
+        output = handler(input_data)
+        if hook_event == "UserPromptSubmit":
+            # Prompts never produce notifications, answer right away
+            return output
+    elif hook_event in HOOK_EVENT_SOUNDS:
+        play_sound_async(HOOK_EVENT_SOUNDS[hook_event])
     
-    elif hook_event == "PostToolUse" and tool_name:
-        handle_tool_execution(tool_name, tool_response)
+    # Clear notifications at session end (the only event that looks at them)
+    if hook_event == "Stop":
+        try:
+            with open(NOTIFICATIONS_FILE, 'r+') as f:
+                if f.read().strip():
+                    f.truncate(0)
+        except OSError:
+            pass
     
-    elif hook_event == "PreToolUse" and tool_name:
-        # Play start sounds for certain tools
-        if tool_name == "Bash":
-            play_sound_async("item_small.wav")
-        elif tool_name == "Task":
-            play_sound_async("notification.wav")
+    return None
+
+def reap_children():
+    """Collect players (and the sound daemon) that have exited
     
-    elif hook_event in HOOK_EVENT_SOUNDS:
-        play_sound_async(HOOK_EVENT_SOUNDS[hook_event])
+    posix_spawn leaves waiting to us. A one-shot hook exits long before its
+    players do, but the --stdin-loop server would otherwise collect a zombie
+    per sound. Nothing in this process waits on its own children, so any
+    finished child can be reaped.
+    """
+    if not hasattr(os, "WNOHANG"):
+        return
+    while True:
+        try:
+            pid = os.waitpid(-1, os.WNOHANG)[0]
+        except ChildProcessError:
+            return
+        if not pid:
+            return
+
+def serve_stdin_loop():
+    """Answer newline-delimited JSON events on stdin with one JSON line each
     
-    # Check for notifications to display
-    temp_dir = Path(tempfile.gettempdir())
-    notifications_file = temp_dir / "zelda_notifications.log"
-    if notifications_file.exists():
+    Lets long-running callers (e.g. create_demo.py) reuse one hook process
+    instead of paying interpreter startup for every event.
+    """
+    for line in sys.stdin:
+        reap_children()
+        
+        try:
+            input_data = json_loads(line)
+        except ValueError:
+            input_data = None
+        
         try:
-            with open(notifications_file, 'r') as f:
-                notifications = f.read().strip()
+            # Pick up config edits made while this process has been running
+            if _manager is not None:
+                _manager.refresh_config()
             
-            if notifications and hook_event == "Stop":
-                # Display notifications at session end
-                for line in notifications.split('\n'):
-                    if line.startswith("ACHIEVEMENT:"):
-                        achievement = line.replace("ACHIEVEMENT:", "").strip()
-                        # Could return this to Claude Code somehow
-                
-                # Clear notifications after displaying
-                notifications_file.unlink()
-        except:
-            pass
+            output = handle_event(input_data) if isinstance(input_data, dict) else None
+        except Exception as e:
+            # A bad event only fails itself, like a one-shot hook process would
+            print(f"zelda_hook: {type(e).__name__}: {e}", file=sys.stderr)
+            output = None
+        
+        sys.stdout.write(json.dumps(output or {}) + "\n")
+        sys.stdout.flush()
+
+# Finds the event name in a raw payload (escaped quotes inside strings can't match)
+EVENT_NAME_RE = re.compile(rb'"hook_event_name"\s*:\s*"([^"\\]*)"')
+
+def is_noop_payload(raw):
+    """Spot payloads the hook would ignore without decoding them
+    
+    Unknown events and ordinary (non-@zelda) prompts do nothing, so the hook
+    can exit before parsing JSON or loading the manager.
+    """
+    match = EVENT_NAME_RE.search(raw)
+    if not match:
+        return False
+    
+    hook_event = match.group(1).decode("utf-8", "replace")
+    if hook_event == "UserPromptSubmit":
+        # A \u escape could spell "@zelda", so only plain text counts as a no-op
+        return b"@zelda" not in raw.lower() and b"\\u" not in raw
+    return hook_event not in EVENT_HANDLERS and hook_event not in HOOK_EVENT_SOUNDS
+
+def main():
+    """Main hook handler"""
+    if "--stdin-loop" in sys.argv[1:]:
+        serve_stdin_loop()
+        sys.exit(0)
+    
+    # Read the whole payload in one go and decode the raw bytes
+    raw = sys.stdin.buffer.read()
+    if is_noop_payload(raw):
+        sys.exit(0)
+    
+    try:
+        input_data = json_loads(raw)
+    except ValueError:
+        sys.exit(0)
+    
+    output = handle_event(input_data)
+    if output:
+        print(json.dumps(output))
     
     sys.exit(0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+File helpers shared by the Zelda Claude Code installers
+(universal_installer.py and verify_and_fix_installation.py)
+"""
+
+import json
+import os
+import shutil
+
+def backup_file(src, dst):
+    """Back up src as a hard link (no bytes copied), copying if that's not possible"""
+    # A link to a symlink would follow later edits, so copy those
+    if not src.is_symlink():
+        try:
+            if dst.exists():
+                dst.unlink()
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # Cross-device, unsupported filesystem, ...
+    shutil.copy2(src, dst)
+
+def write_json_atomic(path, data):
+    """Write JSON to a temp file and rename it over path
+    
+    Replacing the file (instead of truncating it) keeps hard-linked
+    backups of the previous contents intact. The new file takes over the
+    old one's permissions.
+    """
+    target = path.resolve()  # Keep symlinked settings files symlinked
+    temp_path = target.with_name(target.name + '.tmp')
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    try:
+        shutil.copymode(target, temp_path)
+    except OSError:
+        pass  # New file, keep the default mode
+    os.replace(temp_path, target)
@@ -4,82 +4,76 @@ Performance Optimization Module for Zelda Claude Code
 Implements caching, debouncing, and async processing
 """
 
+import atexit
 import json
+import os
 import time
 import asyncio
+import copy
 import subprocess
 from pathlib import Path
-from typing import Dict, Optional, Set
-from collections import deque
-from threading import Lock, Thread
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Set, Tuple
+from collections import OrderedDict, deque
+from queue import Empty, Queue
+from threading import BoundedSemaphore, Lock, Thread, Timer
 from concurrent.futures import ThreadPoolExecutor
 import mmap
 import hashlib
 
 class SoundCache:
-    """In-memory sound file cache with preloading"""
+    """Sound file path cache
+    
+    Players like afplay take a file path, so only resolved paths are kept;
+    sounds are never read into memory.
+    """
     
     def __init__(self, sounds_dir: Path):
         self.sounds_dir = sounds_dir
-        self.cache: Dict[str, bytes] = {}
-        self.cache_lock = Lock()
-        self.preload_common_sounds()
+        self.resolved: Dict[str, Optional[Path]] = {}
     
-    def preload_common_sounds(self):
-        """Preload frequently used sounds into memory"""
-        common_sounds = [
-            "success.wav", "error.wav", "todo_complete.wav",
-            "item_small.wav", "heart_get.wav", "achievement.wav",
-            "session_start.wav", "damage.wav", "search_found.wav"
-        ]
+    def get_sound_path_or_cache(self, sound_name: str) -> Optional[Path]:
+        """Get the path for a sound, or None if it doesn't exist"""
+        # The sounds directory doesn't change during a session, so hits and
+        # misses are both remembered and each name is stat'd at most once.
+        try:
+            return self.resolved[sound_name]
+        except KeyError:
+            pass
         
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            for sound in common_sounds:
-                executor.submit(self._load_sound, sound)
-    
-    def _load_sound(self, sound_name: str) -> Optional[bytes]:
-        """Load a sound file into cache"""
         sound_path = self.sounds_dir / sound_name
-        if not sound_path.exists():
-            return None
-        
-        with self.cache_lock:
-            if sound_name not in self.cache:
-                try:
-                    with open(sound_path, 'rb') as f:
-                        self.cache[sound_name] = f.read()
-                except Exception:
-                    return None
-        
-        return self.cache.get(sound_name)
-    
-    def get_sound_path_or_cache(self, sound_name: str) -> Optional[Path]:
-        """Get sound from cache or return path for streaming"""
-        # For now, return path since afplay needs file path
-        # Future: implement memory-mapped playback
-        return self.sounds_dir / sound_name if (self.sounds_dir / sound_name).exists() else None
+        resolved = sound_path if sound_path.exists() else None
+        self.resolved[sound_name] = resolved
+        return resolved
 
 
 class CommandDebouncer:
     """Debounce rapid command executions"""
     
-    def __init__(self, threshold_ms: int = 100):
+    def __init__(self, threshold_ms: int = 100, max_entries: int = 10):
         self.threshold_ms = threshold_ms
-        self.last_commands: deque = deque(maxlen=10)
-        self.lock = Lock()
+        self.max_entries = max_entries
+        # command -> last run (monotonic ms), least recently run first
+        self.last_commands: "OrderedDict[str, float]" = OrderedDict()
     
     def should_process(self, command: str) -> bool:
         """Check if command should be processed or debounced"""
-        current_time = time.time() * 1000
+        current_time = time.monotonic() * 1000
         
-        with self.lock:
-            # Check if same command was executed recently
-            for cmd_time, cmd in self.last_commands:
-                if cmd == command and (current_time - cmd_time) < self.threshold_ms:
-                    return False
-            
-            self.last_commands.append((current_time, command))
-            return True
+        # Check if same command was executed recently
+        if current_time - self.last_commands.get(command, float("-inf")) < self.threshold_ms:
+            return False
+        
+        self.last_commands[command] = current_time
+        self.last_commands.move_to_end(command)
+        
+        # Drop from the old end: entries past the threshold, or beyond
+        # max_entries (like the old deque(maxlen=10)). Amortized O(1).
+        while len(self.last_commands) > self.max_entries or \
+                current_time - next(iter(self.last_commands.values())) >= self.threshold_ms:
+            self.last_commands.popitem(last=False)
+        
+        return True
 
 
 class AsyncSoundPlayer:
@@ -88,16 +82,14 @@ class AsyncSoundPlayer:
     def __init__(self, max_concurrent: int = 3):
         self.max_concurrent = max_concurrent
         self.play_queue = asyncio.Queue()
-        self.currently_playing = 0
+        self.slots = BoundedSemaphore(max_concurrent)
         self.executor = ThreadPoolExecutor(max_workers=max_concurrent)
     
     async def play_sound_async(self, sound_path: Path, volume: float = 1.0):
         """Play sound asynchronously without blocking"""
-        if self.currently_playing >= self.max_concurrent:
+        if not self.slots.acquire(blocking=False):
             return  # Drop sound if too many playing
         
-        self.currently_playing += 1
-        
         def play():
             try:
                 subprocess.run(
@@ -107,7 +99,7 @@ class AsyncSoundPlayer:
                     timeout=10
                 )
             finally:
-                self.currently_playing -= 1
+                self.slots.release()
         
         # Submit to thread pool
         self.executor.submit(play)
@@ -117,48 +109,95 @@ class OptimizedFileIO:
     """Optimized file I/O with memory mapping and caching"""
     
     def __init__(self):
-        self.file_cache: Dict[Path, Dict] = {}
+        # path -> ((mtime_ns, size), parsed data)
+        self.file_cache: Dict[Path, Tuple[Tuple[int, int], Dict]] = {}
         self.cache_lock = Lock()
-        self.cache_ttl = 60  # Cache for 60 seconds
-        self.last_cache_time: Dict[Path, float] = {}
+        
+        # One writer thread, started on the first write
+        self.write_queue: Queue = Queue()
+        self.writer: Optional[Thread] = None
+    
+    @staticmethod
+    def _signature(file_path: Path) -> Tuple[int, int]:
+        """Cheap change detector for a file: its mtime and size"""
+        st = os.stat(file_path)
+        return (st.st_mtime_ns, st.st_size)
     
-    def read_json_cached(self, file_path: Path) -> Dict:
-        """Read JSON with caching"""
+    def read_json_cached(self, file_path: Path) -> Mapping:
+        """Read JSON with caching, re-parsing only when the file has changed
+        
+        Returns a read-only view of the cached data; use
+        read_json_cached_mutable() to get a copy that is safe to modify.
+        """
+        try:
+            signature = self._signature(file_path)
+        except OSError:
+            return MappingProxyType({})
+        
         with self.cache_lock:
             # Check cache validity
-            if file_path in self.file_cache:
-                if time.time() - self.last_cache_time.get(file_path, 0) < self.cache_ttl:
-                    return self.file_cache[file_path].copy()
+            cached = self.file_cache.get(file_path)
+            if cached is not None and cached[0] == signature:
+                return MappingProxyType(cached[1])
             
             # Read from disk
             try:
                 with open(file_path, 'r') as f:
                     data = json.load(f)
-                    self.file_cache[file_path] = data
-                    self.last_cache_time[file_path] = time.time()
-                    return data.copy()
+                self.file_cache[file_path] = (signature, data)
+                return MappingProxyType(data)
             except Exception:
-                return {}
+                return MappingProxyType({})
+    
+    def read_json_cached_mutable(self, file_path: Path) -> Dict:
+        """Read JSON with caching, returning a private copy of the data"""
+        return copy.deepcopy(dict(self.read_json_cached(file_path)))
     
     def write_json_async(self, file_path: Path, data: Dict):
-        """Write JSON asynchronously"""
-        def write():
-            try:
-                # Write to temp file first
-                temp_path = file_path.with_suffix('.tmp')
-                with open(temp_path, 'w') as f:
-                    json.dump(data, f, indent=2)
-                # Atomic rename
-                temp_path.replace(file_path)
-                
-                # Update cache
-                with self.cache_lock:
-                    self.file_cache[file_path] = data
-                    self.last_cache_time[file_path] = time.time()
-            except Exception:
-                pass
-        
-        Thread(target=write, daemon=True).start()
+        """Write JSON asynchronously on the shared writer thread"""
+        with self.cache_lock:
+            if self.writer is None:
+                self.writer = Thread(target=self._write_loop, name="zelda-writer", daemon=True)
+                self.writer.start()
+                atexit.register(self.flush)
+        self.write_queue.put((file_path, data))
+    
+    def flush(self):
+        """Block until every queued write has reached disk"""
+        self.write_queue.join()
+    
+    def _write_loop(self):
+        """Write queued files, keeping only the latest data for each path"""
+        while True:
+            pending = [self.write_queue.get()]
+            while True:
+                try:
+                    pending.append(self.write_queue.get_nowait())
+                except Empty:
+                    break
+            
+            # A burst of writes to one file only needs its last version
+            for file_path, data in dict(pending).items():
+                self._write_file(file_path, data)
+            
+            for _ in pending:
+                self.write_queue.task_done()
+    
+    def _write_file(self, file_path: Path, data: Dict):
+        """Atomically replace file_path with data and update the cache"""
+        try:
+            # Write to temp file first
+            temp_path = file_path.with_suffix('.tmp')
+            with open(temp_path, 'w') as f:
+                f.write(json.dumps(data, indent=2))
+            # Atomic rename
+            temp_path.replace(file_path)
+            
+            # Update cache
+            with self.cache_lock:
+                self.file_cache[file_path] = (self._signature(file_path), data)
+        except Exception:
+            pass
 
 
 class BatchProcessor:
@@ -169,10 +208,11 @@ class BatchProcessor:
         self.flush_interval = flush_interval
         self.pending_operations = []
         self.lock = Lock()
-        self.last_flush = time.time()
+        self.flush_timer: Optional[Timer] = None
         
-        # Start background flusher
-        Thread(target=self._background_flush, daemon=True).start()
+        # One pool for the processor's lifetime; pending work runs at exit
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="zelda-batch")
+        atexit.register(self.shutdown)
     
     def add_operation(self, operation: callable):
         """Add operation to batch"""
@@ -181,28 +221,53 @@ class BatchProcessor:
             
             if len(self.pending_operations) >= self.batch_size:
                 self._flush()
+            elif self.flush_timer is None:
+                # Flush a partial batch once it has waited flush_interval
+                self.flush_timer = Timer(self.flush_interval, self._timed_flush)
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
     
     def _flush(self):
         """Execute all pending operations"""
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+        
         if not self.pending_operations:
             return
         
         operations = self.pending_operations.copy()
         self.pending_operations.clear()
-        self.last_flush = time.time()
         
-        # Execute in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            for op in operations:
-                executor.submit(op)
+        # Execute in parallel without waiting for the batch to finish
+        for op in operations:
+            self.executor.submit(op)
     
-    def _background_flush(self):
-        """Periodically flush pending operations"""
-        while True:
-            time.sleep(self.flush_interval)
-            with self.lock:
-                if self.pending_operations and (time.time() - self.last_flush) > self.flush_interval:
-                    self._flush()
+    def shutdown(self):
+        """Run pending operations and wait for submitted ones to complete
+        
+        Pending operations run on the calling thread: at interpreter exit
+        concurrent.futures has already stopped taking new work.
+        """
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            operations = self.pending_operations.copy()
+            self.pending_operations.clear()
+        
+        self.executor.shutdown(wait=True)
+        for op in operations:
+            try:
+                op()
+            except Exception:
+                pass  # Same as a failed op in the pool: nobody is waiting on it
+    
+    def _timed_flush(self):
+        """Flush a partial batch when its timer fires"""
+        with self.lock:
+            self.flush_timer = None
+            self._flush()
 
 
 class PerformanceMonitor:
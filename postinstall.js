@@ -156,6 +156,21 @@ function checkPython() {
     return false;
 }
 
+// Precompile the modules the hook imports so each hook run loads cached bytecode
+function precompilePythonModules() {
+    const pythonCmd = getPythonCommand();
+    const modules = ['zelda_core.py', 'performance_optimizations.py', path.join('scripts', 'sound_client.py')]
+        .map(name => path.join(packageDir, name))
+        .filter(file => fs.existsSync(file))
+        .map(file => `"${file}"`);
+    try {
+        execSync(`${pythonCmd} -m compileall -q ${modules.join(' ')}`, { stdio: 'ignore' });
+        console.log('✅ Precompiled Python modules');
+    } catch (e) {
+        // Not fatal - Python compiles them on first import instead
+    }
+}
+
 // Test sound playback
 function testSoundPlayback() {
     console.log('\n🔊 Testing sound playback...');
@@ -197,6 +212,8 @@ async function install() {
         process.exit(1);
     }
     
+    precompilePythonModules();
+    
     // Try universal installer first
     const universalSuccess = runUniversalInstaller();
     
@@ -6,87 +6,84 @@ Plays sound effects for different events
 
 import sys
 import os
-import platform
 import subprocess
-from pathlib import Path
 
-def play_sound_mac(file_path):
-    """Play sound on macOS using afplay"""
-    subprocess.run(['afplay', file_path], check=False)
+from sound_client import SYSTEM, find_player, spawn_player, play_with_daemon
 
-def play_sound_linux(file_path):
-    """Play sound on Linux using various tools"""
-    # Try different Linux audio players in order of preference
-    players = ['aplay', 'paplay', 'ffplay', 'mpg123']
-    for player in players:
-        try:
-            if player == 'ffplay':
-                subprocess.run([player, '-nodisp', '-autoexit', file_path], 
-                             check=False, stderr=subprocess.DEVNULL)
-            else:
-                subprocess.run([player, file_path], check=False)
-            return
-        except FileNotFoundError:
-            continue
-    print(f"No audio player found. Install aplay, paplay, or ffplay", file=sys.stderr)
+# Sounds live next to the scripts folder
+SOUNDS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sounds')
 
-def play_sound_windows(file_path):
-    """Play sound on Windows using PowerShell"""
-    ps_command = f'''
-    Add-Type -TypeDefinition @"
-    using System.Media;
-    public class Sound {{
-        public static void Play(string file) {{
-            var player = new SoundPlayer(file);
-            player.PlaySync();
-        }}
-    }}
-"@
-    [Sound]::Play("{file_path}")
-    '''
-    subprocess.run(['powershell', '-Command', ps_command], check=False)
+# Map event types to sound files
+SOUND_MAP = {
+    'success': 'success.wav',
+    'complete': 'item_get.wav',
+    'error': 'error.wav',
+    'warning': 'warning.wav',
+    'start': 'menu_select.wav',
+    'progress': 'rupee.wav',
+    'test_pass': 'puzzle_solved.wav',
+    'test_fail': 'damage.wav',
+    'todo_complete': 'secret.wav'
+}
 
-def play_sound(sound_type):
-    """Play a sound based on the event type"""
-    # Get the base directory (parent of scripts folder)
-    base_dir = Path(__file__).parent.parent
-    sounds_dir = base_dir / 'sounds'
-    
-    # Map event types to sound files
-    sound_map = {
-        'success': 'success.wav',
-        'complete': 'item_get.wav',
-        'error': 'error.wav',
-        'warning': 'warning.wav',
-        'start': 'menu_select.wav',
-        'progress': 'rupee.wav',
-        'test_pass': 'puzzle_solved.wav',
-        'test_fail': 'damage.wav',
-        'todo_complete': 'secret.wav'
-    }
+def run_player(args, wait=True):
+    """Run a player command, waiting for it to finish unless wait is False"""
+    if wait:
+        subprocess.run(args, check=False, stderr=subprocess.DEVNULL)
+    else:
+        spawn_player(args)
+
+def play_sound_unix(file_path, wait=True):
+    """Play sound on macOS (afplay) or Linux (aplay, paplay, ffplay or mpg123)"""
+    player = find_player()
+    if player:
+        run_player(player + [file_path], wait)
+    elif wait:
+        print(f"No audio player found. Install aplay, paplay, or ffplay", file=sys.stderr)
+
+def play_sound_windows(file_path, wait=True):
+    """Play sound on Windows using the built-in winsound module"""
+    import winsound
+    flags = winsound.SND_FILENAME | winsound.SND_NODEFAULT
+    if not wait:
+        flags |= winsound.SND_ASYNC
+    winsound.PlaySound(file_path, flags)
+
+# Player function for this platform, None if unsupported
+PLATFORM_PLAYER = {
+    'Darwin': play_sound_unix,
+    'Linux': play_sound_unix,
+    'Windows': play_sound_windows,
+}.get(SYSTEM)
+
+def play_sound(sound_type, wait=True):
+    """Play a sound based on the event type
     
+    With wait=False playback is started in the background and nothing is
+    printed, so hooks are never blocked or cluttered.
+    """
     # Get the sound file
-    sound_file = sound_map.get(sound_type, 'default.wav')
-    file_path = sounds_dir / sound_file
+    file_path = os.path.join(SOUNDS_DIR, SOUND_MAP.get(sound_type, 'default.wav'))
     
     # Check if file exists
-    if not file_path.exists():
-        print(f"Sound file not found: {file_path}", file=sys.stderr)
+    if not os.path.isfile(file_path):
+        if wait:
+            print(f"Sound file not found: {file_path}", file=sys.stderr)
+        return
+    
+    # Background sounds go through the sound daemon when it is running
+    if not wait and SYSTEM in ('Darwin', 'Linux') and play_with_daemon([file_path]):
         return
     
     # Play sound based on platform
-    system = platform.system()
     try:
-        if system == 'Darwin':  # macOS
-            play_sound_mac(str(file_path))
-        elif system == 'Linux':
-            play_sound_linux(str(file_path))
-        elif system == 'Windows':
-            play_sound_windows(str(file_path))
-        else:
-            print(f"Unsupported platform: {system}", file=sys.stderr)
+        if PLATFORM_PLAYER:
+            PLATFORM_PLAYER(file_path, wait)
+        elif wait:
+            print(f"Unsupported platform: {SYSTEM}", file=sys.stderr)
     except Exception as e:
-        print(f"Error playing sound: {e}", file=sys.stderr)
+        if wait:
+            print(f"Error playing sound: {e}", file=sys.stderr)
 
 def main():
     """Main entry point"""
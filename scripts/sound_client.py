@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Sound daemon client for Claude Code hooks
+Player lookup, player launching and the daemon's socket, shared by
+zelda_hook.py, play_sound.py and sound_daemon.py
+"""
+
+import os
+import sys
+import shutil
+
+# Platform, named as platform.system() would (without importing platform)
+SYSTEM = {'darwin': 'Darwin', 'win32': 'Windows'}.get(sys.platform, sys.platform.capitalize())
+
+# Players in order of preference, with the arguments each one needs
+PLAYER_COMMANDS = {
+    'Darwin': [['afplay']],
+    'Linux': [['aplay'], ['paplay'], ['ffplay', '-nodisp', '-autoexit'], ['mpg123']],
+}
+
+# Resolved player command, found on first use
+_player_command = None
+
+def find_player():
+    """Return the command prefix of the first installed player, or None"""
+    global _player_command
+    if _player_command is None:
+        _player_command = []
+        for command in PLAYER_COMMANDS.get(SYSTEM, []):
+            player = shutil.which(command[0])
+            if player:
+                _player_command = [player] + command[1:]
+                break
+    return _player_command or None
+
+# Let posix_spawn point stdin, stdout and stderr at /dev/null itself
+if hasattr(os, "posix_spawn"):
+    QUIET_FILE_ACTIONS = [
+        (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ]
+
+def spawn_player(args):
+    """Start a sound player in the background with its output discarded
+
+    args[0] is the absolute path find_player() returns, so os.posix_spawn
+    needs no PATH search and skips most of subprocess.Popen's setup.
+    Returns the player's pid.
+    """
+    if hasattr(os, "posix_spawn"):
+        return os.posix_spawn(args[0], args, os.environ, file_actions=QUIET_FILE_ACTIONS)
+    import subprocess
+    return subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    ).pid
+
+# The daemon's socket and lock live in a directory only this user can use:
+# the session's runtime dir, else ~/.zelda/run (created 0700 by the daemon).
+# A name in the shared temp dir could be taken over by another user.
+DAEMON_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sound_daemon.py")
+if hasattr(os, "getuid"):
+    RUN_DIR = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(os.path.expanduser("~"), ".zelda", "run")
+    SOCKET_PATH = os.path.join(RUN_DIR, "zelda_sound.sock")
+else:
+    RUN_DIR = SOCKET_PATH = None  # No Unix sockets, no daemon
+_daemon_socket = None
+_daemon_started = False
+
+def start_sound_daemon():
+    """Launch the sound daemon in the background, detached from this process
+
+    Skipped when no player is installed: the daemon would exit straight
+    away, and every event would pay for another interpreter start.
+    """
+    global _daemon_started
+    if _daemon_started or not find_player():
+        return
+    _daemon_started = True
+    args = [sys.executable, DAEMON_SCRIPT]
+    try:
+        if hasattr(os, "posix_spawn"):
+            os.posix_spawn(sys.executable, args, os.environ, file_actions=QUIET_FILE_ACTIONS, setsid=True)
+        else:
+            import subprocess
+            subprocess.Popen(
+                args,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+    except OSError:
+        pass
+
+def play_with_daemon(sound_paths, spacing_ms=0):
+    """Hand sounds to the sound daemon in one datagram
+
+    Each line is "<delay_ms>\t<path>", so the daemon spaces the sounds out
+    and the caller never waits. Returns False if the daemon could not take
+    them, starting the daemon for later sounds when it is not running; the
+    caller then plays them directly.
+    """
+    global _daemon_socket
+    if SOCKET_PATH is None:
+        return False
+    message = "\n".join(f"{i * spacing_ms}\t{path}" for i, path in enumerate(sound_paths))
+    try:
+        if _daemon_socket is None:
+            import socket
+            _daemon_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            _daemon_socket.setblocking(False)
+        _daemon_socket.sendto(message.encode(), SOCKET_PATH)
+        return True
+    except (FileNotFoundError, ConnectionRefusedError):
+        start_sound_daemon()
+        return False
+    except OSError:
+        return False
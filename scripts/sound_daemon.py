@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Sound daemon for Claude Code hooks
+Keeps one process per user listening on a Unix datagram socket so hooks can
+hand off a sound with a single sendto() instead of spawning a player each time
+"""
+
+import os
+import sys
+import time
+import heapq
+import socket
+import signal
+
+from sound_client import RUN_DIR, SOCKET_PATH, find_player, spawn_player
+
+SOUNDS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sounds")
+
+# Seconds without a request before the daemon exits
+IDLE_TIMEOUT = 300
+
+# Most players allowed to run at once; extra requests are dropped
+MAX_CONCURRENT = 3
+
+def acquire_lock():
+    """Take the per-user daemon lock, returning its descriptor or None if held
+
+    O_NOFOLLOW refuses a symlink planted in place of the lock file; any
+    other error opening it is raised to the caller.
+    """
+    import fcntl
+    fd = os.open(SOCKET_PATH + ".lock", os.O_WRONLY | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+def parse_request(data, sounds_dir):
+    """Turn a datagram into (delay_seconds, sound_path) pairs
+
+    Each line is "<delay_ms>\t<path>" (a bare path means no delay). Only
+    files directly inside sounds_dir (a resolved path) are played; the file
+    itself may be a symlink, e.g. to a customized sound kept elsewhere.
+    """
+    requests = []
+    for line in data.decode("utf-8", "replace").splitlines():
+        delay_ms, sep, sound_path = line.partition("\t")
+        if not sep:
+            delay_ms, sound_path = "0", line
+        sound_path = os.path.abspath(sound_path)
+        if os.path.realpath(os.path.dirname(sound_path)) != sounds_dir or not os.path.isfile(sound_path):
+            continue
+        try:
+            requests.append((max(int(delay_ms), 0) / 1000, sound_path))
+        except ValueError:
+            continue
+    return requests
+
+def reap(running):
+    """Remove players that have finished from the running set"""
+    for pid in list(running):
+        try:
+            finished = os.waitpid(pid, os.WNOHANG)[0]
+        except ChildProcessError:
+            finished = pid
+        if finished:
+            running.discard(pid)
+
+def serve(sock, player):
+    """Play requested sounds until the daemon has been idle for IDLE_TIMEOUT"""
+    sounds_dir = os.path.realpath(SOUNDS_DIR)
+    running = set()  # pids of players still playing
+    pending = []  # heap of (due time, sound path)
+
+    while True:
+        now = time.monotonic()
+        while pending and pending[0][0] <= now:
+            sound_path = heapq.heappop(pending)[1]
+
+            reap(running)
+            if len(running) >= MAX_CONCURRENT:
+                continue
+
+            try:
+                running.add(spawn_player(player + [sound_path]))
+            except OSError:
+                pass
+
+        # Wake up for the next scheduled sound, otherwise wait out the idle timeout
+        sock.settimeout(pending[0][0] - now if pending else IDLE_TIMEOUT)
+        try:
+            data = sock.recv(4096)
+        except socket.timeout:
+            if pending:
+                continue
+            return
+
+        now = time.monotonic()
+        for delay, sound_path in parse_request(data, sounds_dir):
+            heapq.heappush(pending, (now + delay, sound_path))
+
+def main():
+    """Main entry point"""
+    player = find_player()
+    if not player:
+        sys.exit(0)  # Nothing to play with, hooks fall back to direct playback
+
+    # Any failure setting up means no daemon: hooks play sounds directly
+    try:
+        os.makedirs(RUN_DIR, mode=0o700, exist_ok=True)
+        lock_fd = acquire_lock()
+    except OSError:
+        sys.exit(0)
+    if lock_fd is None:
+        sys.exit(0)  # Another daemon is already running
+
+    path = SOCKET_PATH
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    old_umask = os.umask(0o077)  # Socket is only writable by this user
+    try:
+        try:
+            os.unlink(path)  # Stale socket from a previous daemon
+        except FileNotFoundError:
+            pass
+        sock.bind(path)
+    except OSError:
+        sys.exit(0)
+    finally:
+        os.umask(old_umask)
+
+    # Clean up the socket on a plain kill too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        serve(sock, player)
+    finally:
+        os.unlink(path)
+        sock.close()
+        os.close(lock_fd)
+
+if __name__ == "__main__":
+    main()
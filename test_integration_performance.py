@@ -47,14 +47,15 @@ class TestHookIntegration(unittest.TestCase):
         """Test that hook properly debounces rapid commands"""
         with patch('hooks.zelda_hook.SOUNDS_DIR', self.sounds_dir):
             with patch('hooks.zelda_hook.get_optimizations', return_value=self.opts):
-                with patch('subprocess.Popen') as mock_popen:
+                with patch('hooks.zelda_hook.spawn_player') as mock_spawn, \
+                     patch('hooks.zelda_hook.play_with_daemon', return_value=False):
                     # Simulate rapid tool executions
                     for i in range(5):
                         zelda_hook.handle_tool_execution("Bash", {"exitCode": 0})
                     
                     # Should have been debounced - only first should play
                     # (plus potential combo sounds)
-                    call_count = mock_popen.call_count
+                    call_count = mock_spawn.call_count
                     self.assertLess(call_count, 5, "Commands should be debounced")
     
     def test_hook_with_caching(self):
@@ -66,7 +67,7 @@ class TestHookIntegration(unittest.TestCase):
                 self.assertIsNotNone(sound_path1)
                 
                 # Record cache state
-                self.assertIn("success.wav", self.opts["sound_cache"].cache)
+                self.assertIn("success.wav", self.opts["sound_cache"].resolved)
                 
                 # Second access should use cache
                 sound_path2 = self.opts["sound_cache"].get_sound_path_or_cache("success.wav")
@@ -76,7 +77,8 @@ class TestHookIntegration(unittest.TestCase):
         """Test that performance metrics are recorded"""
         with patch('hooks.zelda_hook.SOUNDS_DIR', self.sounds_dir):
             with patch('hooks.zelda_hook.get_optimizations', return_value=self.opts):
-                with patch('subprocess.Popen'):
+                with patch('hooks.zelda_hook.spawn_player'), \
+                     patch('hooks.zelda_hook.play_with_daemon', return_value=False):
                     # Execute command with monitoring
                     zelda_hook.handle_tool_execution("Read", {"success": True})
                     
@@ -186,7 +188,7 @@ class TestRapidCommandScenarios(unittest.TestCase):
                     opts["sound_cache"].get_sound_path_or_cache(sound)
                 
                 # All should be cached
-                self.assertGreaterEqual(len(opts["sound_cache"].cache), 5)
+                self.assertGreaterEqual(len(opts["sound_cache"].resolved), 5)
                 
         finally:
             import shutil
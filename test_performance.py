@@ -4,6 +4,7 @@ Comprehensive Unit Tests for Performance Optimizations
 Tests all optimization components individually
 """
 
+import asyncio
 import unittest
 import time
 import json
@@ -37,13 +38,16 @@ class TestSoundCache(unittest.TestCase):
         import shutil
         shutil.rmtree(self.temp_dir)
     
-    def test_preload_common_sounds(self):
-        """Test that common sounds are preloaded"""
+    def test_sounds_resolved_lazily(self):
+        """Test that sounds are only looked up on first use"""
         cache = SoundCache(self.sounds_dir)
         
-        # Check that preloaded sounds are in cache
-        self.assertIn("success.wav", cache.cache)
-        self.assertIn("error.wav", cache.cache)
+        # Nothing is touched up front
+        self.assertEqual(cache.resolved, {})
+        
+        cache.get_sound_path_or_cache("success.wav")
+        self.assertIn("success.wav", cache.resolved)
+        self.assertNotIn("error.wav", cache.resolved)
     
     def test_get_sound_path_or_cache(self):
         """Test sound retrieval from cache"""
@@ -58,6 +62,21 @@ class TestSoundCache(unittest.TestCase):
         path = cache.get_sound_path_or_cache("nonexistent.wav")
         self.assertIsNone(path)
     
+    def test_sound_lookup_memoized(self):
+        """Test that hits and misses are resolved only once"""
+        cache = SoundCache(self.sounds_dir)
+        
+        self.assertIsNone(cache.get_sound_path_or_cache("late.wav"))
+        
+        # A file appearing later doesn't invalidate the negative entry
+        (self.sounds_dir / "late.wav").write_bytes(b"fake_sound_data")
+        self.assertIsNone(cache.get_sound_path_or_cache("late.wav"))
+        
+        # Positive lookups return the same resolved path
+        path1 = cache.get_sound_path_or_cache("success.wav")
+        path2 = cache.get_sound_path_or_cache("success.wav")
+        self.assertIs(path1, path2)
+    
     def test_thread_safety(self):
         """Test thread-safe cache access"""
         cache = SoundCache(self.sounds_dir)
@@ -66,7 +85,7 @@ class TestSoundCache(unittest.TestCase):
         results = []
         
         def load_sound():
-            path = cache._load_sound("test.wav")
+            path = cache.get_sound_path_or_cache("test.wav")
             results.append(path is not None)
         
         threads = [threading.Thread(target=load_sound) for _ in range(10)]
@@ -110,6 +129,51 @@ class TestCommandDebouncer(unittest.TestCase):
         
         # Check that history is limited (maxlen=10)
         self.assertLessEqual(len(debouncer.last_commands), 10)
+    
+    def test_history_bounded_within_window(self):
+        """Test that many distinct commands inside the window stay capped"""
+        debouncer = CommandDebouncer(threshold_ms=60_000)
+        
+        for i in range(1000):
+            self.assertTrue(debouncer.should_process(f"cmd{i}"))
+        
+        # Only the most recent commands are remembered
+        self.assertEqual(list(debouncer.last_commands), [f"cmd{i}" for i in range(990, 1000)])
+        self.assertFalse(debouncer.should_process("cmd999"))
+
+
+class TestAsyncSoundPlayer(unittest.TestCase):
+    """Test async sound player concurrency limits"""
+    
+    def setUp(self):
+        # Run on a private loop so other tests keep a usable default loop
+        self.loop = asyncio.new_event_loop()
+    
+    def tearDown(self):
+        self.loop.close()
+        # Python 3.8's asyncio.Queue() needs a current loop to exist
+        asyncio.set_event_loop(asyncio.new_event_loop())
+    
+    def test_max_concurrent_enforced(self):
+        """Test that sounds beyond max_concurrent are dropped"""
+        import threading
+        
+        player = AsyncSoundPlayer(max_concurrent=2)
+        release = threading.Event()
+        
+        with patch('subprocess.run', side_effect=lambda *a, **k: release.wait(1)) as mock_run:
+            async def play_many():
+                for _ in range(5):
+                    await player.play_sound_async(Path("test.wav"))
+            self.loop.run_until_complete(play_many())
+            
+            release.set()
+            player.executor.shutdown(wait=True)
+            
+            self.assertEqual(mock_run.call_count, 2)
+        
+        # Slots are returned once playback finishes
+        self.assertTrue(player.slots.acquire(blocking=False))
 
 
 class TestOptimizedFileIO(unittest.TestCase):
@@ -140,6 +204,19 @@ class TestOptimizedFileIO(unittest.TestCase):
         # Verify cache was used (data should be in cache)
         self.assertIn(self.temp_path, file_io.file_cache)
     
+    def test_cached_data_read_only(self):
+        """Test that cached reads can't be modified in place"""
+        file_io = OptimizedFileIO()
+        
+        data = file_io.read_json_cached(self.temp_path)
+        with self.assertRaises(TypeError):
+            data["test"] = "changed"
+        
+        # Mutable reads get their own copy
+        mutable = file_io.read_json_cached_mutable(self.temp_path)
+        mutable["test"] = "changed"
+        self.assertEqual(file_io.read_json_cached(self.temp_path), self.test_data)
+    
     def test_write_json_async(self):
         """Test asynchronous JSON writing"""
         file_io = OptimizedFileIO()
@@ -159,25 +236,43 @@ class TestOptimizedFileIO(unittest.TestCase):
         cached_data = file_io.read_json_cached(self.temp_path)
         self.assertEqual(cached_data, new_data)
     
-    def test_cache_ttl(self):
-        """Test cache TTL expiration"""
+    def test_burst_writes_keep_last(self):
+        """Test that a burst of writes to one file leaves the last version"""
+        file_io = OptimizedFileIO()
+        for i in range(20):
+            file_io.write_json_async(self.temp_path, {"count": i})
+        file_io.flush()
+        
+        with open(self.temp_path, 'r') as f:
+            self.assertEqual(json.load(f), {"count": 19})
+        self.assertEqual(file_io.read_json_cached(self.temp_path), {"count": 19})
+    
+    def test_cache_invalidated_on_change(self):
+        """Test that a modified file is re-read straight away"""
         file_io = OptimizedFileIO()
-        file_io.cache_ttl = 0.1  # 100ms TTL for testing
         
         # Read and cache
         data1 = file_io.read_json_cached(self.temp_path)
         
-        # Wait for cache to expire
-        time.sleep(0.15)
-        
         # Modify file
         new_data = {"modified": True}
         with open(self.temp_path, 'w') as f:
             json.dump(new_data, f)
         
-        # Read should get new data (cache expired)
+        # Read should get new data without waiting for any expiry
         data2 = file_io.read_json_cached(self.temp_path)
         self.assertEqual(data2, new_data)
+    
+    def test_unchanged_file_not_reparsed(self):
+        """Test that an unchanged file is served from cache"""
+        file_io = OptimizedFileIO()
+        file_io.read_json_cached(self.temp_path)
+        
+        with patch('json.load') as mock_load:
+            data = file_io.read_json_cached(self.temp_path)
+        
+        mock_load.assert_not_called()
+        self.assertEqual(data, self.test_data)
 
 
 class TestBatchProcessor(unittest.TestCase):
@@ -216,6 +311,36 @@ class TestBatchProcessor(unittest.TestCase):
         
         # Should have flushed even though batch not full
         self.assertEqual(len(results), 2)
+    
+    def test_shutdown_runs_pending(self):
+        """Test that shutdown flushes and waits for pending operations"""
+        processor = BatchProcessor(batch_size=10, flush_interval=10.0)
+        
+        results = []
+        processor.add_operation(lambda: results.append(1))
+        
+        processor.shutdown()
+        
+        self.assertEqual(results, [1])
+    
+    def test_pending_run_at_exit(self):
+        """Test that operations still pending at interpreter exit are run"""
+        import subprocess
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            marker = Path(temp_dir) / "ran"
+            script = (
+                "import sys\n"
+                f"sys.path.insert(0, {str(Path(__file__).parent)!r})\n"
+                "from performance_optimizations import BatchProcessor\n"
+                "processor = BatchProcessor(batch_size=10, flush_interval=10.0)\n"
+                f"processor.add_operation(lambda: open({str(marker)!r}, 'w').close())\n"
+            )
+            result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=30)
+            
+            self.assertEqual(result.returncode, 0)
+            self.assertEqual(result.stderr, "")
+            self.assertTrue(marker.exists())
 
 
 class TestPerformanceMonitor(unittest.TestCase):
@@ -230,6 +230,8 @@ def test_zelda_core_module():
             # Check data was loaded
             assert manager2.all_time_stats.total_commands >= 2
             assert manager2.all_time_stats.total_successes >= 2
+            assert manager2.all_time_stats.tool_usage.get("Edit", 0) >= 1
+            assert manager2.all_time_stats.favorite_tool in manager2.all_time_stats.tool_usage
         runner.test("Data persistence", test_persistence)
         
         # Test 8: Sound mapping
@@ -249,6 +251,24 @@ def test_zelda_core_module():
             assert len(all_sounds) >= 0  # May not always return sounds
         runner.test("Sound mapping", test_sound_mapping)
         
+        # Test 9: Long-running processes save changes without waiting for exit
+        def test_interval_flush():
+            manager = zelda_core.ZeldaManager()
+            manager.start_session("test_session_2")
+            zelda_core.ACHIEVEMENTS_FILE.unlink(missing_ok=True)
+            manager._dirty.add("achievements")
+            
+            # Within the interval changes stay in memory
+            manager.record_command("Read", True)
+            assert not zelda_core.ACHIEVEMENTS_FILE.exists()
+            
+            # Once it has passed, the next command writes them
+            manager._last_flush -= zelda_core.FLUSH_INTERVAL
+            manager.record_command("Read", True)
+            assert zelda_core.ACHIEVEMENTS_FILE.exists()
+            assert not manager._dirty
+        runner.test("Interval flush", test_interval_flush)
+        
     finally:
         # Restore original data directory
         zelda_core.ZELDA_DIR = original_dir
@@ -343,6 +363,53 @@ def test_hook_integration():
             assert output.get('decision') != 'block'
     runner.test("Normal prompt passthrough", test_normal_prompt)
     
+    # Test 6: Persistent hook answers one JSON line per event
+    def test_stdin_loop():
+        input_data = "\n".join([
+            json.dumps({"hook_event_name": "UserPromptSubmit", "prompt": "@zelda help"}),
+            json.dumps({"hook_event_name": "UserPromptSubmit", "prompt": "normal user message"}),
+        ]) + "\n"
+        
+        result = subprocess.run(
+            ["python3", "hooks/zelda_hook.py", "--stdin-loop"],
+            input=input_data,
+            capture_output=True,
+            text=True
+        )
+        
+        assert result.returncode == 0, f"Hook failed: {result.stderr}"
+        lines = result.stdout.splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])['decision'] == 'block'
+        assert json.loads(lines[1]) == {}
+    runner.test("Persistent stdin loop", test_stdin_loop)
+    
+    # Test 7: Only payloads the hook would ignore skip decoding
+    def test_noop_payloads():
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "hooks"))
+        import zelda_hook
+        
+        def is_noop(payload):
+            return zelda_hook.is_noop_payload(json.dumps(payload).encode())
+        
+        # Unknown events and ordinary prompts do nothing
+        assert is_noop({"hook_event_name": "SomeFutureEvent", "session_id": "abc"})
+        assert is_noop({"hook_event_name": "UserPromptSubmit", "prompt": "normal user message"})
+        
+        # Handled events and @zelda prompts run, whatever the key order
+        assert not is_noop({"hook_event_name": "PostToolUse", "tool_name": "Bash"})
+        assert not is_noop({"hook_event_name": "Notification"})
+        assert not is_noop({"prompt": "@Zelda stats", "hook_event_name": "UserPromptSubmit"})
+        assert not is_noop({"prompt": '"hook_event_name": "Unknown"', "hook_event_name": "Stop"})
+        
+        # Escaped event names and prompts are left for the JSON decoder
+        assert not zelda_hook.is_noop_payload(b'{"hook_event_name": "\\u0053top"}')
+        assert not zelda_hook.is_noop_payload(
+            b'{"prompt": "\\u0040zelda help", "hook_event_name": "UserPromptSubmit"}'
+        )
+        assert not zelda_hook.is_noop_payload(b'not json')
+    runner.test("No-op payload detection", test_noop_payloads)
+    
     return runner
 
 def test_sound_system():
@@ -387,6 +454,79 @@ def test_sound_system():
         assert script_path.exists(), "Sound player doesn't exist"
     runner.test("Sound player exists", test_sound_player)
     
+    # Test 4: Sound daemon script
+    def test_sound_daemon():
+        script_path = Path("scripts/sound_daemon.py")
+        assert script_path.exists(), "Sound daemon doesn't exist"
+    runner.test("Sound daemon exists", test_sound_daemon)
+    
+    # Test 5: Daemon only plays our own sounds, with the requested delays
+    def test_daemon_requests():
+        if platform.system() == 'Windows':
+            return  # The daemon is macOS/Linux only
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+        import sound_daemon
+        
+        test_dir = tempfile.mkdtemp()
+        try:
+            sounds_dir = os.path.join(test_dir, "sounds")
+            os.mkdir(sounds_dir)
+            success = os.path.join(sounds_dir, "success.wav")
+            error = os.path.join(sounds_dir, "error.wav")
+            custom = os.path.join(sounds_dir, "custom.wav")
+            outside = os.path.join(test_dir, "outside.wav")
+            for path in (success, error, outside):
+                Path(path).write_bytes(b"RIFF")
+            os.symlink(outside, custom)  # A customized sound kept elsewhere
+            real_dir = os.path.realpath(sounds_dir)
+            
+            data = f"0\t{success}\n200\t{error}\n-50\t{custom}\n{error}".encode()
+            assert sound_daemon.parse_request(data, real_dir) == [
+                (0, success), (0.2, error), (0, custom), (0, error)
+            ]
+            
+            # Outside sounds/, escaping it with "..", missing files and bad delays
+            data = "\n".join([
+                f"0\t{outside}",
+                f"0\t{sounds_dir}/../outside.wav",
+                f"0\t{sounds_dir}/missing.wav",
+                f"soon\t{success}",
+            ]).encode()
+            assert sound_daemon.parse_request(data, real_dir) == []
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+    runner.test("Sound daemon request parsing", test_daemon_requests)
+    
+    # Test 6: Hook plays sounds itself while the daemon is not running
+    def test_daemon_fallback():
+        if platform.system() == 'Windows':
+            return  # Windows uses winsound, not the daemon
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "hooks"))
+        import types
+        import zelda_hook
+        import sound_client
+        
+        spawned, started = [], []
+        saved_hook = (zelda_hook._manager, zelda_hook.spawn_player)
+        saved_client = (sound_client._player_command, sound_client.SOCKET_PATH, sound_client.start_sound_daemon)
+        socket_dir = tempfile.mkdtemp()
+        try:
+            zelda_hook._manager = types.SimpleNamespace(sounds_enabled=True)
+            zelda_hook.spawn_player = spawned.append
+            sound_client._player_command = ["/usr/bin/aplay"]
+            sound_client.SOCKET_PATH = os.path.join(socket_dir, "missing.sock")
+            sound_client.start_sound_daemon = lambda: started.append(True)
+            zelda_hook.play_sound_async("success.wav")
+        finally:
+            zelda_hook._manager, zelda_hook.spawn_player = saved_hook
+            (sound_client._player_command, sound_client.SOCKET_PATH,
+             sound_client.start_sound_daemon) = saved_client
+            shutil.rmtree(socket_dir, ignore_errors=True)
+        
+        assert started, "Daemon was not started"
+        assert spawned == [["/usr/bin/aplay", zelda_hook.SOUND_PATHS["success.wav"]]]
+    runner.test("Hook falls back to direct playback", test_daemon_fallback)
+    
     return runner
 
 def test_installation():
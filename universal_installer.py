@@ -14,6 +14,8 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
+from install_utils import backup_file, write_json_atomic
+
 # Color codes
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -33,6 +35,7 @@ class UniversalInstaller:
         self.zelda_dir = self.home_dir / ".zelda"
         self.issues = []
         self.fixes = []
+        self._python_command = None
         
     def check_python_version(self):
         """Ensure Python 3.6+ is available"""
@@ -58,9 +61,17 @@ class UniversalInstaller:
                 self.fixes.append(f"Created {dir_path}")
     
     def get_python_command(self):
-        """Get the correct Python command for this system"""
-        # Try different Python commands
+        """Get the correct Python command for this system (resolved once)"""
+        if self._python_command is None:
+            self._python_command = self._find_python_command()
+        return self._python_command
+    
+    def _find_python_command(self):
+        """Probe for a Python 3 interpreter"""
+        # Try different Python commands, skipping ones that are not on PATH
         for cmd in ['python3', 'python', sys.executable]:
+            if not shutil.which(cmd):
+                continue
             try:
                 result = subprocess.run([cmd, '--version'], 
                                       capture_output=True, text=True)
@@ -89,67 +100,16 @@ class UniversalInstaller:
     def create_compliant_settings(self):
         """Create Claude Code settings that comply with official spec"""
         hook_cmd = self.get_hook_command()
+        # Every event runs the same hook; 5 second timeout for sounds
+        hook_entry = {"type": "command", "command": hook_cmd, "timeout": 5}
         
-        # Build spec-compliant configuration
+        # Build spec-compliant configuration: PostToolUse matches all tools,
+        # other events take no matcher
         hooks_config = {
-            # PostToolUse with matcher for all tools
-            "PostToolUse": [
-                {
-                    "matcher": "*",  # Match all tools
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": hook_cmd,
-                            "timeout": 5  # 5 second timeout for sounds
-                        }
-                    ]
-                }
-            ],
-            # Other events without matcher
-            "UserPromptSubmit": [
-                {
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": hook_cmd,
-                            "timeout": 5
-                        }
-                    ]
-                }
-            ],
-            "SessionStart": [
-                {
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": hook_cmd,
-                            "timeout": 5
-                        }
-                    ]
-                }
-            ],
-            "Stop": [
-                {
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": hook_cmd,
-                            "timeout": 5
-                        }
-                    ]
-                }
-            ],
-            "Notification": [
-                {
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": hook_cmd,
-                            "timeout": 5
-                        }
-                    ]
-                }
-            ]
+            event: [{"matcher": "*", "hooks": [hook_entry]} if event == "PostToolUse"
+                    else {"hooks": [hook_entry]}]
+            for event in ("PostToolUse", "UserPromptSubmit", "SessionStart",
+                          "Stop", "Notification")
         }
         
         return hooks_config
@@ -160,18 +120,19 @@ class UniversalInstaller:
         
         # Load existing settings or create new
         existing_settings = {}
-        if self.settings_file.exists():
-            try:
-                with open(self.settings_file, 'r') as f:
-                    existing_settings = json.load(f)
-                # Backup existing
-                backup_name = f"settings.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                backup_path = self.claude_dir / backup_name
-                shutil.copy2(self.settings_file, backup_path)
-                self.fixes.append(f"Backed up settings to {backup_name}")
-            except Exception as e:
-                self.issues.append(f"Could not read existing settings: {e}")
-                existing_settings = {}
+        try:
+            with open(self.settings_file, 'r') as f:
+                existing_settings = json.load(f)
+            # Backup existing
+            backup_name = f"settings.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            backup_path = self.claude_dir / backup_name
+            backup_file(self.settings_file, backup_path)
+            self.fixes.append(f"Backed up settings to {backup_name}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.issues.append(f"Could not read existing settings: {e}")
+            existing_settings = {}
         
         # Get compliant hooks configuration
         hooks_config = self.create_compliant_settings()
@@ -185,8 +146,7 @@ class UniversalInstaller:
         
         # Write updated settings
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(existing_settings, f, indent=2)
+            write_json_atomic(self.settings_file, existing_settings)
             print_color("✅ Settings updated with spec-compliant configuration", GREEN)
             return True
         except Exception as e:
@@ -224,7 +184,8 @@ class UniversalInstaller:
                     [python_cmd, str(hook_path)],
                     input=json.dumps(event),
                     text=True,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=2
                 )
                 
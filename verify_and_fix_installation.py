@@ -10,6 +10,8 @@ import subprocess
 from pathlib import Path
 import shutil
 
+from install_utils import backup_file, write_json_atomic
+
 # Color codes for output
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -22,11 +24,7 @@ def print_color(message, color=NC):
 
 def check_command(command):
     """Check if a command is available"""
-    try:
-        subprocess.run(['which', command], capture_output=True, check=True)
-        return True
-    except:
-        return False
+    return shutil.which(command) is not None
 
 def test_sound_playback():
     """Test if sound playback works"""
@@ -36,12 +34,15 @@ def test_sound_playback():
     
     try:
         if sys.platform == "darwin":
-            subprocess.run(['afplay', str(test_sound)], capture_output=True, timeout=2)
+            subprocess.run(['afplay', str(test_sound)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2)
         elif sys.platform.startswith('linux'):
             if check_command('aplay'):
-                subprocess.run(['aplay', str(test_sound)], capture_output=True, timeout=2)
+                subprocess.run(['aplay', str(test_sound)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2)
             elif check_command('paplay'):
-                subprocess.run(['paplay', str(test_sound)], capture_output=True, timeout=2)
+                subprocess.run(['paplay', str(test_sound)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2)
         return True, "Sound playback works"
     except Exception as e:
         return False, f"Sound playback failed: {e}"
@@ -97,7 +98,12 @@ def verify_installation():
     # 4. Check sound files
     print_color("\n4. Checking sound files...", YELLOW)
     sounds_dir = project_dir / "sounds"
-    sound_files = list(sounds_dir.glob("*.wav"))
+    # One directory listing answers every check below
+    try:
+        with os.scandir(sounds_dir) as entries:
+            sound_files = {entry.name for entry in entries if entry.name.endswith(".wav")}
+    except OSError:
+        sound_files = set()
     
     if sound_files:
         print_color(f"✅ Found {len(sound_files)} sound files", GREEN)
@@ -109,8 +115,7 @@ def verify_installation():
         ]
         
         for sound_name in essential_sounds:
-            sound_path = sounds_dir / sound_name
-            if sound_path.exists():
+            if sound_name in sound_files:
                 print_color(f"   ✅ {sound_name}", GREEN)
             else:
                 print_color(f"   ⚠️  {sound_name} missing", YELLOW)
@@ -145,22 +150,19 @@ def verify_installation():
                         print_color("⚠️  Hook path may need updating", YELLOW)
                         
                         # Fix the hook configuration
-                        correct_config = {
-                            "PostToolUse": f"python3 {hook_path}",
-                            "UserPromptSubmit": [{"hooks": [{"type": "command", "command": f"python3 {hook_path}"}]}],
-                            "SessionStart": [{"hooks": [{"type": "command", "command": f"python3 {hook_path}"}]}],
-                            "Stop": [{"hooks": [{"type": "command", "command": f"python3 {hook_path}"}]}],
-                            "Notification": [{"hooks": [{"type": "command", "command": f"python3 {hook_path}"}]}]
-                        }
+                        hook_cmd = f"python3 {hook_path}"
+                        correct_config = {"PostToolUse": hook_cmd}
+                        correct_config.update(
+                            (event, [{"hooks": [{"type": "command", "command": hook_cmd}]}])
+                            for event in ("UserPromptSubmit", "SessionStart", "Stop", "Notification")
+                        )
                         
                         settings['hooks'].update(correct_config)
                         
                         # Backup and update
                         backup_path = claude_settings.with_suffix('.json.backup')
-                        shutil.copy2(claude_settings, backup_path)
-                        
-                        with open(claude_settings, 'w') as f:
-                            json.dump(settings, f, indent=2)
+                        backup_file(claude_settings, backup_path)
+                        write_json_atomic(claude_settings, settings)
                         
                         fixes_applied.append("Updated hook paths in settings.json")
                         print_color("✅ Fixed hook configuration", GREEN)
@@ -219,7 +221,8 @@ def verify_installation():
             ['python3', str(project_dir / 'hooks' / 'zelda_hook.py')],
             input=test_event,
             text=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             timeout=2
         )
         
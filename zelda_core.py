@@ -4,28 +4,69 @@ Zelda Core - All-in-one module for Claude Code Zelda integration
 This single module contains all functionality for stats, combos, achievements, and commands
 """
 
+import atexit
 import json
 import os
 import subprocess
 import tempfile
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from enum import Enum
 
+# Prefer orjson for reading and writing the data files when it is installed
+try:
+    import orjson
+    
+    def json_bytes(data) -> bytes:
+        """Encode data as indented JSON"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    def json_line(data) -> bytes:
+        """Encode data as one compact JSON line"""
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    
+    json_loads = orjson.loads
+except ImportError:
+    def json_bytes(data) -> bytes:
+        """Encode data as indented JSON"""
+        return json.dumps(data, indent=2).encode()
+    
+    def json_line(data) -> bytes:
+        """Encode data as one compact JSON line"""
+        return json.dumps(data, separators=(",", ":")).encode() + b"\n"
+    
+    json_loads = json.loads
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
 ZELDA_DIR = Path.home() / ".zelda"
-ZELDA_DIR.mkdir(exist_ok=True)
 
 STATS_FILE = ZELDA_DIR / "stats.json"
 ACHIEVEMENTS_FILE = ZELDA_DIR / "achievements.json"
 CONFIG_FILE = ZELDA_DIR / "config.json"
-SESSIONS_DIR = ZELDA_DIR / "sessions"
-SESSIONS_DIR.mkdir(exist_ok=True)
+SESSIONS_DIR = ZELDA_DIR / "sessions"  # sessions.jsonl, one finished session per line
+
+# Directories are created on the first save rather than at import
+_data_dirs_ready = False
+
+def ensure_data_dirs():
+    """Create the data directories once per process, before the first write"""
+    global _data_dirs_ready
+    if not _data_dirs_ready:
+        ZELDA_DIR.mkdir(exist_ok=True)
+        SESSIONS_DIR.mkdir(exist_ok=True)
+        _data_dirs_ready = True
+
+# Longest a long-running process (e.g. the hook's --stdin-loop) keeps changes unsaved
+FLUSH_INTERVAL = 5.0
+
+# Achievement notifications for the hook (cross-platform temp directory)
+NOTIFICATIONS_LOG = Path(tempfile.gettempdir()) / "zelda_notifications.log"
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -100,6 +141,9 @@ class ComboLevel(Enum):
         self.threshold = threshold
         self.sound = sound
 
+# Streak length -> combo level reached at exactly that length
+COMBO_LEVELS_BY_STREAK = {level.threshold: level for level in ComboLevel if level.threshold}
+
 @dataclass
 class ComboState:
     """Current combo state"""
@@ -131,6 +175,13 @@ ACHIEVEMENTS = {
     "error_free": {"name": "Error Free", "desc": "25 commands without errors", "req": 25, "icon": "💯"},
 }
 
+# Counter each achievement's progress is measured by
+ACHIEVEMENT_COUNTERS = {
+    **dict.fromkeys(["first_step", "apprentice", "journeyman", "master", "legend"], "commands"),
+    **dict.fromkeys(["combo_bronze", "combo_silver", "combo_gold", "combo_platinum"], "streak"),
+    **dict.fromkeys(["flawless_ten", "error_free"], "error_free"),
+}
+
 @dataclass
 class AchievementProgress:
     """Track achievement progress"""
@@ -145,28 +196,57 @@ class ZeldaManager:
     """Main manager for all Zelda features"""
     
     def __init__(self):
+        self._config_signature = self._read_config_signature()
         self.config = self._load_config()
+        self._apply_config()
         self.all_time_stats = self._load_all_time_stats()
         self.current_session: Optional[SessionStats] = None
         self.combo_state = ComboState()
         self.achievement_progress = self._load_achievements()
         self.error_free_count = 0
+        self._notification_log = None
+        
+        # Stores changed since the last save ("stats", "achievements"), written by flush()
+        self._dirty = set()
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
         
     # Configuration Management
+    @staticmethod
+    def _read_config_signature() -> Optional[Tuple[int, int]]:
+        """Cheap change detector for the config file: its mtime and size"""
+        try:
+            st = os.stat(CONFIG_FILE)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+    
+    def _apply_config(self):
+        """Copy the settings read on every event into plain attributes"""
+        self.sounds_enabled = self.config.get("sounds", {}).get("enabled", True)
+        self.volume = self.config.get("volume", 100)
+    
+    def refresh_config(self):
+        """Reload the configuration if the file changed since it was read"""
+        signature = self._read_config_signature()
+        if signature != self._config_signature:
+            self._config_signature = signature
+            self.config = self._load_config()
+            self._apply_config()
+    
     def _load_config(self) -> dict:
         """Load configuration from file"""
-        if CONFIG_FILE.exists():
-            try:
-                with open(CONFIG_FILE, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
+        try:
+            return json_loads(CONFIG_FILE.read_bytes())
+        except:
+            pass
         return DEFAULT_CONFIG.copy()
     
     def save_config(self):
         """Save configuration to file"""
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        ensure_data_dirs()
+        CONFIG_FILE.write_bytes(json_bytes(self.config))
+        self._config_signature = self._read_config_signature()
     
     def update_config(self, key: str, value):
         """Update configuration value"""
@@ -175,24 +255,40 @@ class ZeldaManager:
         for k in keys[:-1]:
             config = config.setdefault(k, {})
         config[keys[-1]] = value
+        self._apply_config()
         self.save_config()
         
     # Statistics Management
     def _load_all_time_stats(self) -> AllTimeStats:
         """Load all-time statistics"""
-        if STATS_FILE.exists():
-            try:
-                with open(STATS_FILE, 'r') as f:
-                    data = json.load(f)
-                    return AllTimeStats(**data)
-            except:
-                pass
+        try:
+            data = json_loads(STATS_FILE.read_bytes())
+            return AllTimeStats(**data)
+        except:
+            pass
         return AllTimeStats()
     
     def save_stats(self):
         """Save statistics to file"""
-        with open(STATS_FILE, 'w') as f:
-            json.dump(asdict(self.all_time_stats), f, indent=2)
+        ensure_data_dirs()
+        STATS_FILE.write_bytes(json_bytes(vars(self.all_time_stats)))
+    
+    def flush(self):
+        """Save every store changed since the last flush (also run at exit)"""
+        dirty, self._dirty = self._dirty, set()
+        self._last_flush = time.monotonic()
+        try:
+            if "stats" in dirty:
+                self.save_stats()
+            if "achievements" in dirty:
+                self.save_achievements()
+        except OSError:
+            pass
+    
+    def _maybe_flush(self):
+        """Flush if something changed and FLUSH_INTERVAL has passed since the last flush"""
+        if self._dirty and time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
     
     def start_session(self, session_id: str):
         """Start a new coding session"""
@@ -203,30 +299,43 @@ class ZeldaManager:
         self.all_time_stats.total_sessions += 1
         self.combo_state = ComboState()  # Reset combo for new session
         self.error_free_count = 0
-        self.save_stats()
+        self._dirty.add("stats")
     
     def end_session(self):
         """End current session"""
         if not self.current_session:
             return
             
-        self.current_session.end_time = datetime.now().isoformat()
+        # One timestamp for everything this session end records
+        now = datetime.now().isoformat()
+        self.current_session.end_time = now
         
         # Update all-time stats
         self.all_time_stats.total_commands += self.current_session.total_commands
         self.all_time_stats.total_successes += self.current_session.successful_commands
         self.all_time_stats.total_failures += self.current_session.failed_commands
         
+        # Fold in the session's tool counts, keeping the favorite current as we go
+        usage = self.all_time_stats.tool_usage
+        favorite = self.all_time_stats.favorite_tool
+        favorite_count = usage.get(favorite, 0)
+        for tool, count in self.current_session.tools_used.items():
+            usage[tool] = usage.get(tool, 0) + count
+            if usage[tool] > favorite_count:
+                favorite, favorite_count = tool, usage[tool]
+        self.all_time_stats.favorite_tool = favorite
+        
         if self.current_session.max_streak > self.all_time_stats.longest_streak:
             self.all_time_stats.longest_streak = self.current_session.max_streak
-            self.all_time_stats.longest_streak_date = datetime.now().isoformat()
+            self.all_time_stats.longest_streak_date = now
         
-        # Save session
-        session_file = SESSIONS_DIR / f"{self.current_session.session_id}.json"
-        with open(session_file, 'w') as f:
-            json.dump(asdict(self.current_session), f, indent=2)
+        # Append the session to the log (one write, no file per session)
+        ensure_data_dirs()
+        with open(SESSIONS_DIR / "sessions.jsonl", "ab") as f:
+            f.write(json_line(vars(self.current_session)))
         
-        self.save_stats()
+        self._dirty.add("stats")
+        self.flush()
         self.current_session = None
     
     def record_command(self, tool_name: str, success: bool) -> List[str]:
@@ -258,6 +367,7 @@ class ZeldaManager:
         achievement_sounds = self._check_achievements()
         sounds.extend(achievement_sounds)
         
+        self._maybe_flush()
         return sounds
     
     def _update_combo(self, success: bool) -> Optional[str]:
@@ -268,13 +378,12 @@ class ZeldaManager:
                 self.combo_state.highest_streak = self.combo_state.current_streak
             
             # Check for combo milestone
-            for level in [ComboLevel.MASTER, ComboLevel.PLATINUM, ComboLevel.GOLD, 
-                         ComboLevel.SILVER, ComboLevel.BRONZE]:
-                if self.combo_state.current_streak == level.threshold:
-                    self.combo_state.last_level_reached = level.name
-                    self.combo_state.total_combos_achieved += 1
-                    if self.config["sounds"]["combo"]:
-                        return level.sound
+            level = COMBO_LEVELS_BY_STREAK.get(self.combo_state.current_streak)
+            if level:
+                self.combo_state.last_level_reached = level.name
+                self.combo_state.total_combos_achieved += 1
+                if self.config["sounds"]["combo"]:
+                    return level.sound
         else:
             # Combo broken
             if self.combo_state.current_streak >= 3:
@@ -293,37 +402,24 @@ class ZeldaManager:
             from performance_optimizations import get_optimizations
             opts = get_optimizations()
             if opts and "file_io" in opts and opts["file_io"] is not None:
-                data = opts["file_io"].read_json_cached(ACHIEVEMENTS_FILE)
+                data = opts["file_io"].read_json_cached_mutable(ACHIEVEMENTS_FILE)
                 if data:
                     return AchievementProgress(**data)
         except (ImportError, AttributeError, KeyError):
             pass
         
         # Fallback to standard file I/O
-        if ACHIEVEMENTS_FILE.exists():
-            try:
-                with open(ACHIEVEMENTS_FILE, 'r') as f:
-                    data = json.load(f)
-                    return AchievementProgress(**data)
-            except:
-                pass
+        try:
+            data = json_loads(ACHIEVEMENTS_FILE.read_bytes())
+            return AchievementProgress(**data)
+        except:
+            pass
         return AchievementProgress()
     
     def save_achievements(self):
-        """Save achievement progress with async support"""
-        # Try to use optimized async file I/O if available
-        try:
-            from performance_optimizations import get_optimizations
-            opts = get_optimizations()
-            if opts and "file_io" in opts and opts["file_io"] is not None:
-                opts["file_io"].write_json_async(ACHIEVEMENTS_FILE, asdict(self.achievement_progress))
-                return
-        except (ImportError, AttributeError, KeyError):
-            pass
-        
-        # Fallback to standard file I/O
-        with open(ACHIEVEMENTS_FILE, 'w') as f:
-            json.dump(asdict(self.achievement_progress), f, indent=2)
+        """Save achievement progress to file"""
+        ensure_data_dirs()
+        ACHIEVEMENTS_FILE.write_bytes(json_bytes(vars(self.achievement_progress)))
     
     def _check_achievements(self) -> List[str]:
         """Check for newly unlocked achievements"""
@@ -331,28 +427,25 @@ class ZeldaManager:
             return []
             
         sounds = []
-        total_commands = self.all_time_stats.total_commands + self.current_session.total_commands
+        counters = {
+            "commands": self.all_time_stats.total_commands + self.current_session.total_commands,
+            "streak": self.combo_state.current_streak,
+            "error_free": self.error_free_count,
+        }
+        unlocked = self.achievement_progress.achievements_unlocked
         
         for aid, adata in ACHIEVEMENTS.items():
-            if aid in self.achievement_progress.achievements_unlocked:
+            if aid in unlocked:
                 continue
-                
-            progress = 0
-            
-            # Check different achievement types
-            if aid in ["first_step", "apprentice", "journeyman", "master", "legend"]:
-                progress = total_commands
-            elif aid in ["combo_bronze", "combo_silver", "combo_gold", "combo_platinum"]:
-                progress = self.combo_state.current_streak
-            elif aid in ["flawless_ten", "error_free"]:
-                progress = self.error_free_count
             
+            progress = counters.get(ACHIEVEMENT_COUNTERS.get(aid), 0)
             self.achievement_progress.progress[aid] = progress
             
             if progress >= adata["req"]:
                 # Achievement unlocked!
-                self.achievement_progress.achievements_unlocked[aid] = datetime.now().isoformat()
+                unlocked[aid] = datetime.now().isoformat()
                 self.current_session.achievements_unlocked.append(aid)
+                self._dirty.add("achievements")
                 
                 if self.config["sounds"]["achievements"]:
                     sounds.append("achievement.wav")
@@ -361,19 +454,16 @@ class ZeldaManager:
                 self._log_achievement(adata["name"], adata["icon"])
                 break  # Only unlock one at a time
         
-        if sounds:
-            self.save_achievements()
-        
         return sounds
     
     def _log_achievement(self, name: str, icon: str):
         """Log achievement unlock for display"""
-        # Use cross-platform temp directory
-        temp_dir = Path(tempfile.gettempdir())
-        log_file = temp_dir / "zelda_notifications.log"
         try:
-            with open(log_file, "a") as f:
-                f.write(f"ACHIEVEMENT:{icon} {name}\n")
+            if self._notification_log is None:
+                # Opened once and line-buffered so each unlock is flushed as written
+                self._notification_log = open(NOTIFICATIONS_LOG, "a", buffering=1)
+                atexit.register(self._notification_log.close)
+            self._notification_log.write(f"ACHIEVEMENT:{icon} {name}\n")
         except Exception:
             # Silently fail if can't write to temp
             pass